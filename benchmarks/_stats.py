@@ -0,0 +1,18 @@
+"""Shared sample statistics for the benchmark scripts."""
+
+import statistics
+
+
+def summarize(times):
+    """Return the median plus min/max/p95, MAD and CV% of timing samples."""
+    s = sorted(times)
+    n = len(s)
+    med = (s[(n - 1) // 2] + s[n // 2]) / 2
+    return {
+        "median": med,
+        "min": s[0],
+        "max": s[-1],
+        "p95": s[min(n - 1, int(n * 0.95))],
+        "mad": statistics.median([abs(x - med) for x in s]),
+        "cv_pct": statistics.pstdev(s) / statistics.fmean(s) * 100,
+    }
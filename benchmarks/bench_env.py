@@ -1,45 +1,39 @@
 """Benchmark: env() overhead vs os.environ.get() (overhead < 0.1ms)."""
 
+import argparse
+import gc
 import json
 import os
 import platform
+import random
 import sys
-import time
-import statistics
+import timeit
+
+# Run as benchmarks/<script>.py, so this directory is on sys.path.
+from _stats import summarize
 
 WARMUP = 5
 MEASURED = 30
 ITERATIONS = 1000
 THRESHOLD_SEC = 0.0001
-
-
-def usage():
-    return "Usage: bench_env.py [--json <output-path>]"
-
-
-def parse_json_arg(argv):
-    json_path = None
-    i = 0
-    while i < len(argv):
-        arg = argv[i]
-        if arg == "--json":
-            if json_path is not None:
-                raise ValueError("--json provided more than once")
-            if i + 1 >= len(argv) or argv[i + 1].startswith("--"):
-                raise ValueError("--json requires an output path")
-            json_path = argv[i + 1]
-            i += 2
-            continue
-        raise ValueError(f"Unknown argument: {arg}")
-    return json_path
-
-
-def runtime_label():
-    return (
-        f"{platform.system()} {platform.machine()}, "
-        f"CPython {sys.version_info.major}.{sys.version_info.minor}."
-        f"{sys.version_info.micro}"
+PLAN_SEED = 0
+RUNTIME_LABEL = (
+    f"{platform.system()} {platform.machine()}, "
+    f"CPython {sys.version_info.major}.{sys.version_info.minor}."
+    f"{sys.version_info.micro}"
+)
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="bench_env.py",
+        usage="%(prog)s [--json <output-path>]",
     )
+    parser.add_argument("--json", nargs="?", const="", metavar="<output-path>")
+    args = parser.parse_args(argv)
+    if args.json == "":
+        parser.error("--json requires an output path")
+    return args
 
 
 def write_json(path, payload):
@@ -51,57 +45,61 @@ def write_json(path, payload):
 
 
 def main():
-    from zodify import env
+    json_path = parse_args(sys.argv[1:]).json
 
-    try:
-        json_path = parse_json_arg(sys.argv[1:])
-    except ValueError as exc:
-        print(f"Error: {exc}", file=sys.stderr)
-        print(usage(), file=sys.stderr)
-        return 2
+    from zodify import env
 
     os.environ["ZODIFY_BENCH_VAR"] = "42"
     try:
         print("Benchmarking: env() per-call overhead vs os.environ.get()")
-        print(f"Runtime: {runtime_label()}")
+        print(f"Runtime: {RUNTIME_LABEL}")
         print("Target: ubuntu-latest x64, CPython 3.12")
+        # timeit runs the inner loop in its own compiled template, so the
+        # per-sample overhead is one timer pair rather than a Python for-loop.
+        # It also disables GC while timing; setup re-enables it on both sides.
+        t_env = timeit.Timer(
+            "env('ZODIFY_BENCH_VAR', int)",
+            setup="gc.enable()",
+            globals={"gc": gc, "env": env},
+        )
+        t_raw = timeit.Timer(
+            "os.environ.get('ZODIFY_BENCH_VAR')",
+            setup="gc.enable()",
+            globals={"gc": gc, "os": os},
+        )
+
         print(f"Protocol: {WARMUP} warmup + {MEASURED} measured runs "
-              f"({ITERATIONS} calls each)")
+              f"({ITERATIONS} calls each, interleaved, seed {PLAN_SEED})")
         print()
 
         # Warmup
-        for _ in range(WARMUP):
-            for _ in range(ITERATIONS):
-                env("ZODIFY_BENCH_VAR", int)
-            for _ in range(ITERATIONS):
-                os.environ.get("ZODIFY_BENCH_VAR")
-
-        # Measure env()
-        env_times = []
-        for _ in range(MEASURED):
-            start = time.perf_counter()
-            for _ in range(ITERATIONS):
-                env("ZODIFY_BENCH_VAR", int)
-            elapsed = time.perf_counter() - start
-            env_times.append(elapsed / ITERATIONS)
-
-        # Measure os.environ.get()
-        raw_times = []
-        for _ in range(MEASURED):
-            start = time.perf_counter()
-            for _ in range(ITERATIONS):
-                os.environ.get("ZODIFY_BENCH_VAR")
-            elapsed = time.perf_counter() - start
-            raw_times.append(elapsed / ITERATIONS)
-
-        env_med = statistics.median(env_times)
-        raw_med = statistics.median(raw_times)
+        t_env.timeit(WARMUP * ITERATIONS)
+        t_raw.timeit(WARMUP * ITERATIONS)
+
+        # Interleave env/raw samples in a seeded shuffled order so CPU
+        # frequency or thermal drift over the run hits both sides alike
+        # instead of biasing the signed delta.
+        plan = ["env", "raw"] * MEASURED
+        random.Random(PLAN_SEED).shuffle(plan)
+        timers = {"env": t_env, "raw": t_raw}
+        samples = {"env": [], "raw": []}
+        for side in plan:
+            samples[side].append(timers[side].timeit(ITERATIONS) / ITERATIONS)
+        env_times = samples["env"]
+        raw_times = samples["raw"]
+
+        env_stats = summarize(env_times)
+        raw_stats = summarize(raw_times)
+        env_med = env_stats["median"]
+        raw_med = raw_stats["median"]
         signed_delta = env_med - raw_med
         overhead = max(0.0, signed_delta)
 
         result = "PASS" if overhead < THRESHOLD_SEC else "FAIL"
         print(f"  env() median:            {env_med * 1000:.4f} ms/call")
         print(f"  os.environ.get() median: {raw_med * 1000:.4f} ms/call")
+        print(f"  env() MAD / CV:          {env_stats['mad'] * 1000:.4f} ms/call, "
+              f"{env_stats['cv_pct']:.1f}%")
         print(f"  Signed delta:            {signed_delta * 1000:.4f} ms/call")
         print(f"  Overhead (normalized):   {overhead * 1000:.4f} ms/call")
         print(f"  Threshold:          {THRESHOLD_SEC * 1000:.4f} ms/call")
@@ -110,10 +108,15 @@ def main():
         if json_path:
             out = {
                 "benchmark": "env",
-                "runtime": runtime_label(),
+                "runtime": RUNTIME_LABEL,
                 "target": "ubuntu-latest x64, CPython 3.12",
+                "iterations_per_sample": ITERATIONS,
                 "env_median_ms": env_med * 1000,
                 "raw_median_ms": raw_med * 1000,
+                "env_p95_ms": env_stats["p95"] * 1000,
+                "env_mad_ms": env_stats["mad"] * 1000,
+                "env_cv_pct": env_stats["cv_pct"],
+                "raw_mad_ms": raw_stats["mad"] * 1000,
                 "signed_delta_ms": signed_delta * 1000,
                 "overhead_ms": overhead * 1000,
                 "threshold_ms": THRESHOLD_SEC * 1000,
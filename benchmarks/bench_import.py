@@ -1,53 +1,66 @@
 """Benchmark: zodify import time (median target < 5ms)."""
 
+import argparse
 import json
 import os
 import platform
+import queue
 import subprocess
 import sys
-import statistics
+import tempfile
+import threading
+
+# Run as benchmarks/<script>.py, so this directory is on sys.path.
+from _stats import summarize
 
 WARMUP = 5
 MEASURED = 30
 TIMEOUT_SEC = 10
 THRESHOLD_SEC = 0.005
-
-
-def usage():
-    return (
-        "Usage: bench_import.py [--json <output-path>] "
-        "[--enforce-threshold]"
-    )
-
-
-def parse_json_arg(argv):
-    json_path = None
-    enforce_threshold = False
-    i = 0
-    while i < len(argv):
-        arg = argv[i]
-        if arg == "--json":
-            if json_path is not None:
-                raise ValueError("--json provided more than once")
-            if i + 1 >= len(argv) or argv[i + 1].startswith("--"):
-                raise ValueError("--json requires an output path")
-            json_path = argv[i + 1]
-            i += 2
-            continue
-        if arg == "--enforce-threshold":
-            enforce_threshold = True
-            i += 1
-            continue
-        raise ValueError(f"Unknown argument: {arg}")
-    return json_path, enforce_threshold
-
-
-def runtime_label():
-    return (
-        f"{platform.system()} {platform.machine()}, "
-        f"CPython {sys.version_info.major}.{sys.version_info.minor}."
-        f"{sys.version_info.micro}"
+RUNTIME_LABEL = (
+    f"{platform.system()} {platform.machine()}, "
+    f"CPython {sys.version_info.major}.{sys.version_info.minor}."
+    f"{sys.version_info.micro}"
+)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Children run isolated (-I) so user site-packages and PYTHON* env vars do not
+# leak in; site itself still runs, because it preloads stdlib modules (os, re,
+# enum, ...) that an application would already have when importing zodify.
+# The repo root is passed as argv[1] so the source tree is what gets imported.
+COLD_IMPORT_CODE = (
+    "import sys, time; sys.path.insert(0, sys.argv[1]); "
+    "s=time.perf_counter(); import zodify; "
+    "print(time.perf_counter()-s)"
+)
+# Long-lived child for --reuse-interpreter: every stdin line requests one
+# re-import after evicting zodify from sys.modules.
+REIMPORT_DRIVER_CODE = (
+    "import sys, time; sys.path.insert(0, sys.argv[1])\n"
+    "for _ in sys.stdin:\n"
+    "    for name in [m for m in sys.modules if m == 'zodify' "
+    "or m.startswith('zodify.')]:\n"
+    "        del sys.modules[name]\n"
+    "    s = time.perf_counter(); import zodify\n"
+    "    print(time.perf_counter() - s, flush=True)\n"
+)
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="bench_import.py",
+        usage=(
+            "%(prog)s [--json <output-path>] [--enforce-threshold] "
+            "[--reuse-interpreter]"
+        ),
     )
+    parser.add_argument("--json", nargs="?", const="", metavar="<output-path>")
+    parser.add_argument("--enforce-threshold", action="store_true")
+    parser.add_argument("--reuse-interpreter", action="store_true")
+    args = parser.parse_args(argv)
+    if args.json == "":
+        parser.error("--json requires an output path")
+    return args
 
 
 def write_json(path, payload):
@@ -62,9 +75,7 @@ def measure_import():
     """Measure import time in a fresh subprocess."""
     try:
         result = subprocess.run(
-            [sys.executable, "-c",
-             "import time; s=time.perf_counter(); import zodify; "
-             "print(time.perf_counter()-s)"],
+            [sys.executable, "-I", "-c", COLD_IMPORT_CODE, ROOT],
             capture_output=True, text=True, check=True,
             timeout=TIMEOUT_SEC,
         )
@@ -76,43 +87,104 @@ def measure_import():
     return float(result.stdout.strip())
 
 
+def _pump_lines(stream, lines):
+    """Forward child stdout lines to a queue; an empty string marks EOF."""
+    for line in stream:
+        lines.put(line)
+    lines.put("")
+
+
+def _child_failure(proc, stderr_file):
+    proc.kill()
+    proc.wait()
+    stderr_file.seek(0)
+    stderr = stderr_file.read().strip()
+    return RuntimeError(f"import benchmark subprocess failed: {stderr}")
+
+
+def measure_reimports(n):
+    """Measure n re-imports driven over stdin in one persistent subprocess."""
+    # stderr goes to a file so a chatty child cannot fill an unread pipe, and
+    # stdout is drained by a thread so every sample can wait with a timeout.
+    with tempfile.TemporaryFile("w+") as stderr_file:
+        proc = subprocess.Popen(
+            [sys.executable, "-I", "-u", "-c", REIMPORT_DRIVER_CODE, ROOT],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=stderr_file,
+            text=True,
+        )
+        lines = queue.Queue()
+        threading.Thread(
+            target=_pump_lines, args=(proc.stdout, lines), daemon=True,
+        ).start()
+        try:
+            times = []
+            for _ in range(n):
+                try:
+                    proc.stdin.write("go\n")
+                    proc.stdin.flush()
+                except BrokenPipeError:
+                    raise _child_failure(proc, stderr_file) from None
+                try:
+                    line = lines.get(timeout=TIMEOUT_SEC)
+                except queue.Empty as exc:
+                    raise RuntimeError("import benchmark subprocess timed out") from exc
+                if not line:
+                    raise _child_failure(proc, stderr_file)
+                times.append(float(line))
+            return times
+        finally:
+            proc.kill()
+            proc.wait()
+
+
 def main():
-    try:
-        json_path, enforce_threshold = parse_json_arg(sys.argv[1:])
-    except ValueError as exc:
-        print(f"Error: {exc}", file=sys.stderr)
-        print(usage(), file=sys.stderr)
-        return 2
+    args = parse_args(sys.argv[1:])
+    json_path = args.json
+    enforce_threshold = args.enforce_threshold
+    reuse_interpreter = args.reuse_interpreter
 
     print("Benchmarking: import zodify")
-    print(f"Runtime: {runtime_label()}")
+    print(f"Runtime: {RUNTIME_LABEL}")
     print("Target: ubuntu-latest x64, CPython 3.12")
-    print(f"Protocol: {WARMUP} warmup + {MEASURED} measured runs")
+    mode = "reuse-interpreter" if reuse_interpreter else "subprocess"
+    print(f"Protocol: {WARMUP} warmup + {MEASURED} measured runs ({mode})")
     print()
 
-    # Warmup
-    for _ in range(WARMUP):
-        measure_import()
+    if reuse_interpreter:
+        # One child process; the first import is cold and doubles as warmup.
+        times = measure_reimports(WARMUP + MEASURED)[WARMUP:]
+    else:
+        # Warmup
+        for _ in range(WARMUP):
+            measure_import()
 
-    # Measured runs
-    times = [measure_import() for _ in range(MEASURED)]
+        # Measured runs
+        times = [measure_import() for _ in range(MEASURED)]
 
-    med = statistics.median(times)
+    stats = summarize(times)
+    med = stats["median"]
     result = "PASS" if med < THRESHOLD_SEC else "FAIL"
     print(f"  Median: {med * 1000:.3f} ms")
-    print(f"  Min:    {min(times) * 1000:.3f} ms")
-    print(f"  Max:    {max(times) * 1000:.3f} ms")
+    print(f"  Min:    {stats['min'] * 1000:.3f} ms")
+    print(f"  Max:    {stats['max'] * 1000:.3f} ms")
+    print(f"  P95:    {stats['p95'] * 1000:.3f} ms")
+    print(f"  MAD:    {stats['mad'] * 1000:.3f} ms")
+    print(f"  CV:     {stats['cv_pct']:.1f}%")
     print(f"  Threshold: {THRESHOLD_SEC * 1000:.3f} ms")
     print(f"  Result: {result} (informational unless --enforce-threshold)")
 
     if json_path:
         data = {
             "benchmark": "import",
-            "runtime": runtime_label(),
+            "runtime": RUNTIME_LABEL,
             "target": "ubuntu-latest x64, CPython 3.12",
+            "mode": mode,
             "median_ms": med * 1000,
-            "min_ms": min(times) * 1000,
-            "max_ms": max(times) * 1000,
+            "min_ms": stats["min"] * 1000,
+            "max_ms": stats["max"] * 1000,
+            "p95_ms": stats["p95"] * 1000,
+            "mad_ms": stats["mad"] * 1000,
+            "cv_pct": stats["cv_pct"],
             "threshold_ms": THRESHOLD_SEC * 1000,
             "result": result,
         }
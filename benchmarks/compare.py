@@ -7,33 +7,33 @@ errors (bad args, missing/invalid baseline file).
 import json
 import os
 import sys
+from collections import namedtuple
 
 REL_TOLERANCE = 0.20  # 20% regression tolerance
 # Tiny medians are noisy on shared CI runners; require a minimum absolute delta.
 ABS_TOLERANCE_FLOOR_MS = 0.0005
+# When the baseline records its median absolute deviation, a noisy metric may
+# widen the allowed delta to MAD_MULTIPLIER * MAD. The MAD comes from samples of
+# a single run, so it never narrows the delta below the relative tolerance.
+MAD_MULTIPLIER = 3
+
+BenchmarkSpec = namedtuple(
+    "BenchmarkSpec", "name label file current_key baseline_key mad_key",
+)
 
 BENCHMARK_SPECS = (
-    {
-        "name": "import",
-        "label": "import median",
-        "file": "import.json",
-        "current_key": "median_ms",
-        "baseline_key": "median_ms",
-    },
-    {
-        "name": "validate",
-        "label": "validate median",
-        "file": "validate.json",
-        "current_key": "median_ms",
-        "baseline_key": "median_ms",
-    },
-    {
-        "name": "env",
-        "label": "env overhead",
-        "file": "env.json",
-        "current_key": "overhead_ms",
-        "baseline_key": "overhead_ms",
-    },
+    BenchmarkSpec(
+        "import", "import median", "import.json",
+        "median_ms", "median_ms", "mad_ms",
+    ),
+    BenchmarkSpec(
+        "validate", "validate median", "validate.json",
+        "median_ms", "median_ms", "mad_ms",
+    ),
+    BenchmarkSpec(
+        "env", "env overhead", "env.json",
+        "overhead_ms", "overhead_ms", "env_mad_ms",
+    ),
 )
 
 
@@ -76,7 +76,7 @@ def parse_args(argv):
     return baseline_path, current_dir, summary_path
 
 
-def compare_metric(name, current_val, baseline_val):
+def compare_metric(name, current_val, baseline_val, baseline_mad=None):
     """Compare a metric and return (passed, message)."""
     if baseline_val <= 0:
         return False, (
@@ -87,6 +87,8 @@ def compare_metric(name, current_val, baseline_val):
     delta = current_val - baseline_val
     pct = (current_val / baseline_val - 1) * 100
     allowed_delta = max(baseline_val * REL_TOLERANCE, ABS_TOLERANCE_FLOOR_MS)
+    if baseline_mad is not None:
+        allowed_delta = max(allowed_delta, baseline_mad * MAD_MULTIPLIER)
     if delta > allowed_delta:
         return False, (
             f"  WARNING {name}: {current_val:.6f} ms "
@@ -137,47 +139,46 @@ def main():
     missing_baseline = 0
 
     for spec in BENCHMARK_SPECS:
-        current_path = os.path.join(current_dir, spec["file"])
-        if not os.path.exists(current_path):
+        try:
+            current = load_json(os.path.join(current_dir, spec.file))
+        except FileNotFoundError:
             missing_results += 1
-            lines.append(f"  SKIP {spec['name']}: no current results")
+            lines.append(f"  SKIP {spec.name}: no current results")
             continue
-
-        try:
-            current = load_json(current_path)
         except (OSError, json.JSONDecodeError) as exc:
             warnings += 1
             lines.append(
-                f"  WARNING {spec['name']}: invalid current JSON ({exc})"
+                f"  WARNING {spec.name}: invalid current JSON ({exc})"
             )
             continue
 
         compared += 1
-        baseline_entry = baseline.get(spec["name"])
+        baseline_entry = baseline.get(spec.name)
         if not isinstance(baseline_entry, dict):
             warnings += 1
             missing_baseline += 1
             lines.append(
-                f"  WARNING {spec['label']}: baseline entry missing"
+                f"  WARNING {spec.label}: baseline entry missing"
             )
-        elif spec["baseline_key"] not in baseline_entry:
+        elif spec.baseline_key not in baseline_entry:
             warnings += 1
             missing_baseline += 1
             lines.append(
-                f"  WARNING {spec['label']}: baseline metric "
-                f"'{spec['baseline_key']}' missing"
+                f"  WARNING {spec.label}: baseline metric "
+                f"'{spec.baseline_key}' missing"
             )
-        elif spec["current_key"] not in current:
+        elif spec.current_key not in current:
             warnings += 1
             lines.append(
-                f"  WARNING {spec['label']}: current metric "
-                f"'{spec['current_key']}' missing"
+                f"  WARNING {spec.label}: current metric "
+                f"'{spec.current_key}' missing"
             )
         else:
             passed, msg = compare_metric(
-                spec["label"],
-                current[spec["current_key"]],
-                baseline_entry[spec["baseline_key"]],
+                spec.label,
+                current[spec.current_key],
+                baseline_entry[spec.baseline_key],
+                baseline_entry.get(spec.mad_key),
             )
             lines.append(msg)
             if not passed:
@@ -187,7 +188,7 @@ def main():
         if result != "PASS":
             warnings += 1
             lines.append(
-                f"  WARNING {spec['name']}: benchmark threshold result={result!r}"
+                f"  WARNING {spec.name}: benchmark threshold result={result!r}"
             )
 
     lines.append("")
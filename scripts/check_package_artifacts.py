@@ -6,6 +6,7 @@ import argparse
 import sys
 import tarfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 EXPECTED_MARKER = "zodify/py.typed"
@@ -18,17 +19,21 @@ def parse_args() -> argparse.Namespace:
 
 
 def check_wheel(path: Path) -> None:
+    # getinfo() is a lookup in the central-directory index ZipFile already built.
     with zipfile.ZipFile(path) as zf:
-        names = set(zf.namelist())
-    if EXPECTED_MARKER not in names:
-        raise ValueError(f"{path.name} is missing {EXPECTED_MARKER}")
+        try:
+            zf.getinfo(EXPECTED_MARKER)
+        except KeyError:
+            raise ValueError(f"{path.name} is missing {EXPECTED_MARKER}") from None
 
 
 def check_sdist(path: Path) -> None:
+    # Stream members so decompression stops as soon as the marker is found.
     with tarfile.open(path, mode="r:gz") as tf:
-        names = tf.getnames()
-    if not any(name.endswith(EXPECTED_MARKER) for name in names):
-        raise ValueError(f"{path.name} is missing {EXPECTED_MARKER}")
+        for member in tf:
+            if member.name.endswith(EXPECTED_MARKER):
+                return
+    raise ValueError(f"{path.name} is missing {EXPECTED_MARKER}")
 
 
 def main() -> int:
@@ -46,13 +51,16 @@ def main() -> int:
         print("expected both wheel and sdist artifacts", file=sys.stderr)
         return 2
 
-    for wheel in wheels:
-        check_wheel(wheel)
-        print(f"OK wheel: {wheel.name}")
+    jobs = [("wheel", check_wheel, wheel) for wheel in wheels]
+    jobs += [("sdist", check_sdist, sdist) for sdist in sdists]
 
-    for sdist in sdists:
-        check_sdist(sdist)
-        print(f"OK sdist: {sdist.name}")
+    # Archive reads are I/O and zlib bound, so threads overlap them; results are
+    # consumed in submission order to keep the log deterministic.
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = [executor.submit(check, path) for _, check, path in jobs]
+        for (kind, _, path), future in zip(jobs, futures):
+            future.result()
+            print(f"OK {kind}: {path.name}")
 
     return 0
 
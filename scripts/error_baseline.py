@@ -7,83 +7,110 @@ Usage:
     diff baseline_before.txt baseline_after.txt
 """
 
-import sys
 import os
+import re
+import sys
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from zodify import validate, env, Optional
+_ADDRESS_RE = re.compile(r"0x[0-9a-fA-F]+")
+_BRACES_RE = re.compile(r"\{([^{}]*)\}")
+
+
+def _sort_braced(match):
+    return "{" + ", ".join(sorted(match.group(1).split(", "))) + "}"
+
 
-errors_collected = []
+def _normalize(message):
+    """Mask object addresses and sort {...} item lists so diffs stay stable."""
+    return _BRACES_RE.sub(_sort_braced, _ADDRESS_RE.sub("0x...", message))
 
 
-def capture(label, fn):
-    """Run fn, capture ValueError/TypeError message."""
+def capture(label, fn, *args, **kwargs):
+    """Call fn(*args, **kwargs), capture ValueError/TypeError message."""
     try:
-        fn()
-        errors_collected.append(f"[{label}] NO ERROR")
+        fn(*args, **kwargs)
+        return f"[{label}] NO ERROR"
     except (ValueError, TypeError) as e:
-        errors_collected.append(f"[{label}] {e}")
-
-
-# --- Type mismatches (primitive) ---
-capture("int_got_str", lambda: validate({"a": int}, {"a": "x"}))
-capture("str_got_int", lambda: validate({"a": str}, {"a": 42}))
-capture("bool_got_int", lambda: validate({"a": bool}, {"a": 1}))
-capture("float_got_str", lambda: validate({"a": float}, {"a": "x"}))
-capture("int_got_bool", lambda: validate({"count": int}, {"count": True}))
-capture("int_got_none", lambda: validate({"a": int}, {"a": None}))
-capture("str_got_none", lambda: validate({"a": str}, {"a": None}))
-
-# --- Missing required keys ---
-capture("missing_single", lambda: validate({"a": int}, {}))
-capture("missing_nested", lambda: validate({"db": {"host": str}}, {"db": {}}))
-capture("missing_multiple", lambda: validate({"a": int, "b": str}, {}))
-
-# --- Unknown key errors ---
-capture("unknown_key", lambda: validate({"a": int}, {"a": 1, "extra": 2}))
-
-# --- Nested dict errors ---
-capture("nested_not_dict", lambda: validate({"db": {"host": str}}, {"db": "notadict"}))
-capture("nested_type_mismatch", lambda: validate({"db": {"port": int}}, {"db": {"port": "bad"}}))
-capture("nested_deep_3", lambda: validate({"a": {"b": {"c": int}}}, {"a": {"b": {"c": "x"}}}))
-capture("nested_none", lambda: validate({"db": {"host": str}}, {"db": None}))
-
-# --- List errors ---
-capture("list_not_list", lambda: validate({"tags": [str]}, {"tags": "notalist"}))
-capture("list_elem_mismatch", lambda: validate({"tags": [str]}, {"tags": ["a", 42]}))
-capture("list_none", lambda: validate({"tags": [str]}, {"tags": None}))
-capture("list_of_dicts_err", lambda: validate({"users": [{"name": str}]}, {"users": [{"name": 42}]}))
-capture("list_of_lists_err", lambda: validate({"m": [[int]]}, {"m": [[1, "bad"]]}))
-
-# --- Coercion failures ---
-capture("coerce_int_fail", lambda: validate({"x": int}, {"x": "abc"}, coerce=True))
-capture("coerce_float_fail", lambda: validate({"x": float}, {"x": "abc"}, coerce=True))
-capture("coerce_bool_fail", lambda: validate({"x": bool}, {"x": "maybe"}, coerce=True))
-capture("coerce_empty_int", lambda: validate({"x": int}, {"x": ""}, coerce=True))
-capture("coerce_empty_float", lambda: validate({"x": float}, {"x": ""}, coerce=True))
-capture("coerce_empty_bool", lambda: validate({"x": bool}, {"x": ""}, coerce=True))
-capture("coerce_bool_non_str", lambda: validate({"x": int}, {"x": True}, coerce=True))
-
-# --- Coercion in lists ---
-capture("list_coerce_fail", lambda: validate({"n": [float]}, {"n": ["bad"]}, coerce=True))
-
-# --- Multi-error aggregation ---
-capture("multi_errors", lambda: validate(
-    {"name": str, "db": {"port": int}, "tags": [str]},
-    {"db": {"port": "bad"}, "tags": ["ok", 42]},
-))
-
-# --- Optional with wrong type ---
-capture("optional_wrong_type", lambda: validate({"port": Optional(int)}, {"port": "abc"}))
-capture("optional_coerce_fail", lambda: validate({"port": Optional(int)}, {"port": "abc"}, coerce=True))
-
-# --- Custom validation failure ---
-capture("callable_fail", lambda: validate({"port": lambda v: 1 <= v <= 65535}, {"port": 99999}))
-
-# --- Set/tuple type mismatch ---
-capture("set_mismatch", lambda: validate({"tags": set}, {"tags": [1, 2]}))
-
-# Print all collected errors deterministically
-for line in errors_collected:
-    print(line)
+        return f"[{label}] {_normalize(str(e))}"
+
+
+def main():
+    # The script takes no arguments; answer -h/--help before importing zodify.
+    args = sys.argv[1:]
+    if args:
+        wants_help = args in (["-h"], ["--help"])
+        print(__doc__.strip(), file=sys.stdout if wants_help else sys.stderr)
+        sys.exit(0 if wants_help else 2)
+
+    from zodify import validate, Optional
+
+    # (label, schema, data, validate kwargs)
+    cases = [
+        # --- Type mismatches (primitive) ---
+        ("int_got_str", {"a": int}, {"a": "x"}, {}),
+        ("str_got_int", {"a": str}, {"a": 42}, {}),
+        ("bool_got_int", {"a": bool}, {"a": 1}, {}),
+        ("float_got_str", {"a": float}, {"a": "x"}, {}),
+        ("int_got_bool", {"count": int}, {"count": True}, {}),
+        ("int_got_none", {"a": int}, {"a": None}, {}),
+        ("str_got_none", {"a": str}, {"a": None}, {}),
+
+        # --- Missing required keys ---
+        ("missing_single", {"a": int}, {}, {}),
+        ("missing_nested", {"db": {"host": str}}, {"db": {}}, {}),
+        ("missing_multiple", {"a": int, "b": str}, {}, {}),
+
+        # --- Unknown key errors ---
+        ("unknown_key", {"a": int}, {"a": 1, "extra": 2}, {}),
+
+        # --- Nested dict errors ---
+        ("nested_not_dict", {"db": {"host": str}}, {"db": "notadict"}, {}),
+        ("nested_type_mismatch", {"db": {"port": int}}, {"db": {"port": "bad"}}, {}),
+        ("nested_deep_3", {"a": {"b": {"c": int}}}, {"a": {"b": {"c": "x"}}}, {}),
+        ("nested_none", {"db": {"host": str}}, {"db": None}, {}),
+
+        # --- List errors ---
+        ("list_not_list", {"tags": [str]}, {"tags": "notalist"}, {}),
+        ("list_elem_mismatch", {"tags": [str]}, {"tags": ["a", 42]}, {}),
+        ("list_none", {"tags": [str]}, {"tags": None}, {}),
+        ("list_of_dicts_err",
+         {"users": [{"name": str}]}, {"users": [{"name": 42}]}, {}),
+        ("list_of_lists_err", {"m": [[int]]}, {"m": [[1, "bad"]]}, {}),
+
+        # --- Coercion failures ---
+        ("coerce_int_fail", {"x": int}, {"x": "abc"}, {"coerce": True}),
+        ("coerce_float_fail", {"x": float}, {"x": "abc"}, {"coerce": True}),
+        ("coerce_bool_fail", {"x": bool}, {"x": "maybe"}, {"coerce": True}),
+        ("coerce_empty_int", {"x": int}, {"x": ""}, {"coerce": True}),
+        ("coerce_empty_float", {"x": float}, {"x": ""}, {"coerce": True}),
+        ("coerce_empty_bool", {"x": bool}, {"x": ""}, {"coerce": True}),
+        ("coerce_bool_non_str", {"x": int}, {"x": True}, {"coerce": True}),
+
+        # --- Coercion in lists ---
+        ("list_coerce_fail", {"n": [float]}, {"n": ["bad"]}, {"coerce": True}),
+
+        # --- Multi-error aggregation ---
+        ("multi_errors",
+         {"name": str, "db": {"port": int}, "tags": [str]},
+         {"db": {"port": "bad"}, "tags": ["ok", 42]}, {}),
+
+        # --- Optional with wrong type ---
+        ("optional_wrong_type", {"port": Optional(int)}, {"port": "abc"}, {}),
+        ("optional_coerce_fail",
+         {"port": Optional(int)}, {"port": "abc"}, {"coerce": True}),
+
+        # --- Custom validation failure ---
+        ("callable_fail", {"port": lambda v: 1 <= v <= 65535}, {"port": 99999}, {}),
+
+        # --- Set/tuple type mismatch ---
+        ("set_mismatch", {"tags": set}, {"tags": [1, 2]}, {}),
+    ]
+
+    # Print all collected errors deterministically
+    for label, schema, data, kwargs in cases:
+        print(capture(label, validate, schema, data, **kwargs))
+
+
+if __name__ == "__main__":
+    main()
@@ -871,6 +871,18 @@ export function DocsPage() {
               # → age: expected int, got str
             </span>
           </CodeBlock>
+          <p className='text-cyber-text/80 leading-relaxed'>
+            Errors are collected across every key by default. Pass{" "}
+            <code className='bg-white/5 px-1.5 py-0.5 rounded text-sm font-mono text-cyber-purple'>
+              fail_fast=True
+            </code>{" "}
+            to stop at the first error and report only that one, in both text
+            and structured modes. It is also available as a{" "}
+            <code className='bg-white/5 px-1.5 py-0.5 rounded text-sm font-mono text-cyber-purple'>
+              Validator(fail_fast=True)
+            </code>{" "}
+            default.
+          </p>
         </section>
 
         {/* Structured Errors */}
@@ -1,29 +1,56 @@
 """Tests for benchmark tooling robustness and signaling behavior."""
 
+import importlib.util
 import json
+import os
 import subprocess
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parent.parent
 COMPARE = ROOT / "benchmarks" / "compare.py"
 BENCH_IMPORT = ROOT / "benchmarks" / "bench_import.py"
 BENCH_VALIDATE = ROOT / "benchmarks" / "bench_validate.py"
 BENCH_ENV = ROOT / "benchmarks" / "bench_env.py"
 
+# Children get a known-minimal environment instead of the full parent one.
+_CHILD_ENV = {
+    "PATH": os.environ.get("PATH", ""),
+    "PYTHONPATH": str(ROOT),
+    "LC_ALL": "C.UTF-8",
+}
+if "SYSTEMROOT" in os.environ:  # required by CPython on Windows
+    _CHILD_ENV["SYSTEMROOT"] = os.environ["SYSTEMROOT"]
+
 
-def _run(*args):
+def _run(*args, env_overrides=None):
     return subprocess.run(
         [sys.executable, *map(str, args)],
         capture_output=True,
         text=True,
+        env={**_CHILD_ENV, **(env_overrides or {})},
+        stdin=subprocess.DEVNULL,
+        close_fds=True,
     )
 
 
-def test_compare_requires_required_args():
-    result = _run(COMPARE, "--baseline", "foo.json")
-    assert result.returncode == 2
-    assert "Usage: compare.py" in result.stderr
+def _load_script(path, monkeypatch):
+    """Import a standalone benchmark script as a module without running main()."""
+    # Scripts import shared helpers from their own directory, as they do when run.
+    monkeypatch.syspath_prepend(path.parent)
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_compare_requires_required_args(monkeypatch, capsys):
+    compare = _load_script(COMPARE, monkeypatch)
+    monkeypatch.setattr(sys, "argv", ["compare.py", "--baseline", "foo.json"])
+    assert compare.main() == 2
+    assert "Usage: compare.py" in capsys.readouterr().err
 
 
 def test_compare_fails_when_baseline_missing(tmp_path):
@@ -63,11 +90,14 @@ def test_compare_reports_missing_baseline_metrics_as_incomplete(tmp_path):
     assert "Comparison incomplete" in result.stdout
 
 
-def test_benchmark_scripts_require_json_path():
-    for script in (BENCH_IMPORT, BENCH_VALIDATE, BENCH_ENV):
-        result = _run(script, "--json")
-        assert result.returncode == 2
-        assert "requires an output path" in result.stderr
+@pytest.mark.parametrize("script", [BENCH_IMPORT, BENCH_VALIDATE, BENCH_ENV])
+def test_benchmark_scripts_require_json_path(script, monkeypatch, capsys):
+    bench = _load_script(script, monkeypatch)
+    monkeypatch.setattr(sys, "argv", [script.name, "--json"])
+    with pytest.raises(SystemExit) as exc_info:
+        bench.main()
+    assert exc_info.value.code == 2
+    assert "requires an output path" in capsys.readouterr().err
 
 
 def test_bench_import_creates_json_parent_dir(tmp_path):
@@ -81,3 +111,67 @@ def test_bench_import_creates_json_parent_dir(tmp_path):
     assert payload["result"] in ("PASS", "FAIL")
     assert "runtime" in payload
     assert "target" in payload
+
+
+def test_bench_import_reuse_interpreter_writes_json(tmp_path):
+    output = tmp_path / "import.json"
+    result = _run(BENCH_IMPORT, "--reuse-interpreter", "--json", output)
+
+    assert result.returncode == 0, result.stderr
+    payload = json.loads(output.read_text())
+    assert payload["mode"] == "reuse-interpreter"
+    assert payload["median_ms"] > 0
+
+
+def test_bench_import_reuse_interpreter_times_out_hung_child(monkeypatch):
+    bench = _load_script(BENCH_IMPORT, monkeypatch)
+    monkeypatch.setattr(bench, "REIMPORT_DRIVER_CODE", "import time; time.sleep(60)")
+    monkeypatch.setattr(bench, "TIMEOUT_SEC", 0.5)
+
+    with pytest.raises(RuntimeError, match="timed out"):
+        bench.measure_reimports(1)
+
+
+def test_bench_import_reuse_interpreter_reports_child_stderr(monkeypatch):
+    bench = _load_script(BENCH_IMPORT, monkeypatch)
+    # More stderr than a pipe buffer holds, then exit before answering.
+    code = "import sys; sys.stderr.write('x' * 200000 + 'boom'); sys.exit(3)"
+    monkeypatch.setattr(bench, "REIMPORT_DRIVER_CODE", code)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        bench.measure_reimports(3)
+
+
+def _compare_validate(tmp_path, baseline_entry, current_median):
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps({"validate": baseline_entry}))
+    current_dir = tmp_path / "out"
+    current_dir.mkdir()
+    (current_dir / "validate.json").write_text(
+        json.dumps({"median_ms": current_median, "result": "PASS"})
+    )
+    return _run(COMPARE, "--baseline", baseline, "--current", current_dir)
+
+
+def test_compare_small_mad_does_not_tighten_relative_tolerance(tmp_path):
+    # +10% is outside median + 3 * MAD but inside the 20% relative tolerance.
+    result = _compare_validate(tmp_path, {"median_ms": 0.01, "mad_ms": 0.0002}, 0.011)
+
+    assert result.returncode == 0
+    assert "OK validate median" in result.stdout
+
+
+def test_compare_large_mad_widens_tolerance(tmp_path):
+    # +25% is outside the 20% relative tolerance but inside 3 * MAD.
+    result = _compare_validate(tmp_path, {"median_ms": 0.01, "mad_ms": 0.001}, 0.0125)
+
+    assert result.returncode == 0
+    assert "OK validate median" in result.stdout
+
+
+def test_compare_warns_beyond_relative_and_mad_tolerance(tmp_path):
+    result = _compare_validate(tmp_path, {"median_ms": 0.01, "mad_ms": 0.0002}, 0.013)
+
+    assert result.returncode == 0
+    assert "WARNING validate median" in result.stdout
+    assert "allowed delta <= 0.002000 ms" in result.stdout
@@ -133,7 +133,13 @@ def test_validator_validate_delegates_to_public_validate_and_preserves_wrapper(
     result = Validator().validate(DatabaseConfig, payload, unknown_keys="strip")
 
     assert captured["schema"] is DatabaseConfig
-    assert captured["kwargs"] == {"coerce": False, "max_depth": 32, "unknown_keys": "strip", "error_mode": "text"}
+    assert captured["kwargs"] == {
+        "coerce": False,
+        "max_depth": 32,
+        "unknown_keys": "strip",
+        "error_mode": "text",
+        "fail_fast": False,
+    }
     assert isinstance(result, DatabaseConfig)
     assert result.host == "db.local"
     assert "extra" not in result
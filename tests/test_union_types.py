@@ -1,8 +1,6 @@
 """Tests for union type validation"""
 
-import ast
-import inspect
-import textwrap
+import collections
 
 import pytest
 import zodify
@@ -10,21 +8,6 @@ import zodify
 from zodify import Optional, validate
 
 
-def _get_check_value_function_ast() -> ast.FunctionDef:
-    """Return parsed AST for zodify._check_value."""
-    source = textwrap.dedent(inspect.getsource(zodify._check_value))
-    module = ast.parse(source)
-    func = module.body[0]
-    assert isinstance(func, ast.FunctionDef)
-    return func
-
-
-def _get_check_value_if_conditions() -> list[str]:
-    """Return top-level if-condition expressions from _check_value."""
-    func = _get_check_value_function_ast()
-    return [ast.unparse(stmt.test) for stmt in func.body if isinstance(stmt, ast.If)]
-
-
 # --- Basic union matching ---
 
 
@@ -84,38 +67,61 @@ def test_validate_union_three_types_mismatch() -> None:
         validate({"value": str | int | float}, {"value": True})
 
 
+def test_validate_union_last_of_many_members_matches() -> None:
+    """{"value": str | int | float | None} with None → passes (NoneType member)"""
+    result = validate({"value": str | int | float | None}, {"value": None})
+    assert result == {"value": None}
+
+
 # --- Args order ---
 
 
-def test_validate_union_first_exact_match_wins() -> None:
-    """Verify union branch iterates __args__ and returns on first exact match."""
-    func = _get_check_value_function_ast()
-    union_branch = next(
-        stmt for stmt in func.body
-        if isinstance(stmt, ast.If)
-        and ast.unparse(stmt.test) == "isinstance(expected, types.UnionType)"
-    )
+def test_validate_union_first_exact_match_wins(monkeypatch: pytest.MonkeyPatch) -> None:
+    """An exact member match returns the value as-is, in __args__ order.
 
-    assert isinstance(union_branch.body[0], ast.For)
-    union_loop = union_branch.body[0]
-    assert ast.unparse(union_loop.iter) == "expected.__args__"
-    assert isinstance(union_loop.body[0], ast.If)
-    match_check = union_loop.body[0]
-    assert ast.unparse(match_check.test) == "type(value) is t and (not coerce or t is not str)"
-    assert any(isinstance(stmt, ast.Return) and ast.unparse(stmt.value) == "value"
-               for stmt in match_check.body)
+    It wins before any coercion is attempted.
+    """
+    calls: list[tuple[object, type]] = []
+    original_coerce = zodify._coerce_value
+
+    def tracking_coerce(value: object, target: type, key: str) -> object:
+        calls.append((value, target))
+        return original_coerce(value, target, key)
+
+    monkeypatch.setattr(zodify, "_coerce_value", tracking_coerce)
+    assert validate({"value": int | bool}, {"value": True}) == {"value": True}
+    assert validate({"value": float | int}, {"value": 1}, coerce=True) == {"value": 1}
+    assert calls == []
 
 
 def test_validate_union_dispatch_position_regression() -> None:
-    """Verify union dispatch position is before type(expected) is type."""
-    conditions = _get_check_value_if_conditions()
-    assert conditions[:5] == [
-        "isinstance(expected, dict)",
-        "isinstance(expected, list) and len(expected) == 1",
-        "isinstance(expected, list)",
-        "isinstance(expected, types.UnionType)",
-        "type(expected) is type",
+    """Each schema kind keeps its own branch.
+
+    Unions are never treated as plain callables.
+    """
+    errors: list[tuple[str, str, str, str]] = []
+    zodify._check_value(1.5, str | int, "u", False, errors, 32, "reject")
+    zodify._check_value("x", int, "t", False, errors, 32, "reject")
+    zodify._check_value("x", {"a": int}, "d", False, errors, 32, "reject")
+    zodify._check_value("x", [int], "l", False, errors, 32, "reject")
+    assert errors == [
+        ("u", "expected str | int, got float", "str | int", "float"),
+        ("t", "expected int, got str", "int", "str"),
+        ("d", "expected dict, got str", "dict", "str"),
+        ("l", "expected list, got str", "list", "str"),
     ]
+    with pytest.raises(TypeError, match="list schema must contain exactly one"):
+        zodify._check_value(["x"], [int, str], "l", False, [], 32, "reject")
+
+
+def test_validate_schema_subclasses_fall_back_to_kind_checks() -> None:
+    """dict/list schema subclasses dispatch like their base kinds."""
+    tags_schema = type("Tags", (list,), {})([str])
+    schema = {"db": collections.OrderedDict(port=int), "tags": tags_schema}
+    result = validate(schema, {"db": {"port": 1}, "tags": ["a"]})
+    assert result == {"db": {"port": 1}, "tags": ["a"]}
+    with pytest.raises(TypeError, match="invalid schema value for key 'x': 5"):
+        validate({"x": 5}, {"x": 1})
 
 
 # --- Union + Optional ---
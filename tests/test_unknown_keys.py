@@ -136,3 +136,18 @@ def test_unknown_keys_depth_exceeded_no_unknown_error():
     msg = str(exc_info.value)
     assert msg == "a: max depth exceeded"
     assert "unknown key" not in msg
+
+
+def test_unknown_keys_reported_when_key_count_matches_schema():
+    # Same number of keys as the schema, but one required key is swapped
+    # for an unknown one; absent optionals must not mask the extra either.
+    with pytest.raises(ValueError) as exc_info:
+        validate(
+            {"a": int, "b": int, "c": Optional(int)},
+            {"a": 1, "x": 2, "y": 3},
+        )
+    assert str(exc_info.value) == (
+        "b: missing required key\n"
+        "x: unknown key\n"
+        "y: unknown key"
+    )
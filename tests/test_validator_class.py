@@ -354,13 +354,16 @@ def test_validator_validate_delegates_to_validate_api_path(
 ) -> None:
     captured: dict[str, object] = {}
 
-    def fake_validate(schema, data, *, coerce, max_depth, unknown_keys, error_mode):
+    def fake_validate(
+        schema, data, *, coerce, max_depth, unknown_keys, error_mode, fail_fast
+    ):
         captured["schema"] = schema
         captured["data"] = data
         captured["coerce"] = coerce
         captured["max_depth"] = max_depth
         captured["unknown_keys"] = unknown_keys
         captured["error_mode"] = error_mode
+        captured["fail_fast"] = fail_fast
         return {"ok": True}
 
     monkeypatch.setattr(zodify, "validate", fake_validate)
@@ -376,4 +379,18 @@ def test_validator_validate_delegates_to_validate_api_path(
         "max_depth": 3,
         "unknown_keys": "strip",
         "error_mode": "structured",
+        "fail_fast": False,
     }
+
+
+def test_validator_fail_fast_default_and_override() -> None:
+    schema = {"a": int, "b": int}
+    data = {"a": "x", "b": "y"}
+
+    with pytest.raises(ValueError) as exc_info:
+        Validator(fail_fast=True).validate(schema, data)
+    assert str(exc_info.value) == "a: expected int, got str"
+
+    with pytest.raises(ValueError) as exc_info:
+        Validator(fail_fast=True).validate(schema, data, fail_fast=False)
+    assert str(exc_info.value) == "a: expected int, got str\nb: expected int, got str"
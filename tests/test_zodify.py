@@ -466,6 +466,14 @@ def test_optional_list():
     assert result == {"tags": []}
 
 
+def test_optional_subclass_still_recognized():
+    class Port(Optional):
+        __slots__ = ()
+
+    assert validate({"port": Port(int, 8080)}, {}) == {"port": 8080}
+    assert validate({"port": Port(int)}, {"port": 1}) == {"port": 1}
+
+
 def test_optional_mixed_required_and_optional():
     with pytest.raises(
         ValueError, match="name: missing required key"
@@ -588,3 +596,112 @@ def test_multi_level_error_aggregation():
     assert "name: missing required key" in msg
     assert "db.port: expected int" in msg
     assert "tags[1]: expected str, got int" in msg
+
+
+# --- validate: exact-type leaf fast path ---
+
+def test_exact_type_leaf_values_are_returned_as_is():
+    name = "".join(["Al", "ice"])  # a fresh, non-interned str object
+    score = 95.5
+    schema = {"name": str, "score": float, "port": int, "db": {"host": str}}
+    data = {"name": name, "score": score, "port": 1, "db": {"host": "h"}}
+
+    result = validate(schema, data, coerce=True)
+    assert result == data
+    assert result["name"] is name
+    assert result["score"] is score
+    assert result["db"] is not data["db"]
+
+    # bool is a subclass of int, not an exact match, so it is still rejected.
+    with pytest.raises(ValueError, match="port: expected int, got bool"):
+        validate(schema, {**data, "port": True})
+
+
+def test_exact_type_leaf_fast_path_keeps_metaclass_schemas_callable():
+    import enum
+
+    class Color(enum.Enum):
+        RED = 1
+
+    # Enum classes are not plain ``type`` instances, so they keep the
+    # callable path and are invoked with the value.
+    assert validate({"c": Color}, {"c": Color.RED}) == {"c": Color.RED}
+    with pytest.raises(ValueError, match="c: custom validation failed"):
+        validate({"c": Color}, {"c": 2})
+
+
+def test_exact_type_list_elements_fast_path_keeps_error_paths():
+    with pytest.raises(ValueError) as exc:
+        validate({"xs": [int]}, {"xs": [1, True, 3, "4"]})
+    assert str(exc.value) == (
+        "xs[1]: expected int, got bool\n"
+        "xs[3]: expected int, got str"
+    )
+    assert validate({"xs": [int]}, {"xs": [1, "2"]}, coerce=True) == {"xs": [1, 2]}
+
+
+def test_exact_type_list_prefix_copy_keeps_bool_trap_and_late_coercion():
+    items = list(range(100))
+    result = validate({"xs": [int]}, {"xs": items})
+    assert result["xs"] == items
+    assert result["xs"] is not items
+
+    with pytest.raises(ValueError) as exc:
+        validate({"xs": [int]}, {"xs": items[:50] + [True] + items[50:]})
+    assert str(exc.value) == "xs[50]: expected int, got bool"
+
+    coerced = validate({"xs": [int]}, {"xs": items + ["5", 7]}, coerce=True)
+    assert coerced["xs"] == items + [5, 7]
+
+
+# --- validate: fail_fast ---
+
+def test_fail_fast_reports_only_first_error():
+    schema = {"a": int, "b": {"c": [int]}, "d": str}
+    data = {"a": 1, "b": {"c": [1, "x", "y"]}, "d": 2, "extra": 0}
+    with pytest.raises(ValueError) as exc:
+        validate(schema, data, fail_fast=True)
+    assert str(exc.value) == "b.c[1]: expected int, got str"
+
+
+def test_fail_fast_structured_and_valid_input():
+    from zodify import ValidationError
+
+    with pytest.raises(ValidationError) as exc:
+        validate({"a": int, "b": int}, {}, fail_fast=True, error_mode="structured")
+    assert exc.value.issues == [{
+        "path": "a", "message": "missing required key",
+        "expected": "required", "got": "missing",
+    }]
+    assert validate({"a": int}, {"a": 1}, fail_fast=True) == {"a": 1}
+
+
+def test_fail_fast_stops_after_failing_custom_validator():
+    def positive(value):
+        if value <= 0:
+            raise ValueError("must be positive")
+        return value
+
+    with pytest.raises(ValueError) as exc:
+        validate({"n": positive, "m": int}, {"n": -1, "m": "x"}, fail_fast=True)
+    assert str(exc.value) == (
+        "n: custom validation failed (ValueError: must be positive)"
+    )
+
+
+def test_fail_fast_error_list_stops_on_every_insert_form():
+    from zodify import _FailFastErrors, _StopValidation
+
+    # The stop signal must not be catchable by ``except Exception``.
+    assert not issubclass(_StopValidation, Exception)
+    error = ("a", "expected int, got str", "int", "str")
+    inserts = (
+        lambda errors: errors.append(error),
+        lambda errors: errors.extend([error]),
+        lambda errors: errors.__iadd__([error]),
+    )
+    for insert in inserts:
+        errors = _FailFastErrors()
+        with pytest.raises(_StopValidation):
+            insert(errors)
+        assert errors == [error]
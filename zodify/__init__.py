@@ -2,14 +2,15 @@
 
 import os
 import types
+from collections.abc import Callable, Iterable
 from typing import Any, Literal, TypeVar, cast as typing_cast, overload
 
 __version__: str = "0.6.0"
 __all__ = ["__version__", "validate", "env", "Validator", "Optional", "ValidationError", "Schema"]
 
 _MISSING: object = object()
-_BOOL_TRUE = {"true", "1", "yes"}
-_BOOL_FALSE = {"false", "0", "no"}
+_BOOL_TRUE = frozenset({"true", "1", "yes"})
+_BOOL_FALSE = frozenset({"false", "0", "no"})
 UnknownKeysMode = Literal["reject", "strip"]
 ErrorMode = Literal["text", "structured"]
 _SchemaT = TypeVar("_SchemaT", bound="Schema")
@@ -78,6 +79,36 @@ class Optional:
         return f"Optional({self.type!r}, {self.default!r})"
 
 
+class _StopValidation(BaseException):
+    """Internal signal that unwinds validation after the first error
+
+    A BaseException, so ``except Exception`` handlers in the engine (or
+    user code it calls) neither swallow it nor treat it as a failure.
+    """
+
+
+class _FailFastErrors(list[tuple[str, str, str, str]]):
+    """Error list that stops validation once the first error is recorded
+
+    Every way the engine adds errors must route through ``append``; the
+    bulk forms are overridden so a new call site cannot bypass the stop.
+    """
+
+    def append(self, error: tuple[str, str, str, str]) -> None:
+        super().append(error)
+        raise _StopValidation from None
+
+    def extend(self, errors: Iterable[tuple[str, str, str, str]]) -> None:
+        for error in errors:
+            self.append(error)
+
+    def __iadd__(  # type: ignore[misc, override]
+        self, errors: Iterable[tuple[str, str, str, str]],
+    ) -> "_FailFastErrors":
+        self.extend(errors)
+        return self
+
+
 def _coerce_value(value: Any, target: type, key: str) -> Any:
     """Coerce a value to the target type"""
     if target is str:
@@ -121,39 +152,89 @@ def _coerce_value(value: Any, target: type, key: str) -> Any:
 
 
 def _resolve_mode_options(
-    unknown_keys: object,
-    error_mode: object,
+    unknown_keys: UnknownKeysMode,
+    error_mode: ErrorMode,
 ) -> tuple[UnknownKeysMode, ErrorMode]:
     """Validate and normalize unknown_keys/error_mode options."""
     if unknown_keys not in ("reject", "strip"):
         raise ValueError("unknown_keys must be 'reject' or 'strip'")
     if error_mode not in ("text", "structured"):
         raise ValueError("error_mode must be 'text' or 'structured'")
-    return (
-        typing_cast(UnknownKeysMode, unknown_keys),
-        typing_cast(ErrorMode, error_mode),
-    )
+    return unknown_keys, error_mode
+
+
+def _check_dict(value: Any, expected: dict[str, Any], key: str, coerce: bool,
+                errors: list[tuple[str, str, str, str]], depth: int,
+                unknown_keys: UnknownKeysMode) -> Any:
+    """Validate a nested dict against a nested schema dict"""
+    if type(value) is not dict:
+        errors.append((key, f"expected dict, got {type(value).__name__}",
+                       "dict", type(value).__name__))
+        return _MISSING
+    return _validate(expected, value, coerce,
+                     key + ".", errors, depth - 1, unknown_keys)
 
 
 def _check_list(value: Any, expected: list[Any], key: str, coerce: bool,
                 errors: list[tuple[str, str, str, str]], depth: int,
                 unknown_keys: UnknownKeysMode) -> Any:
     """Validate each element in a list against the expected type"""
+    if len(expected) != 1:
+        raise TypeError(
+            f"invalid schema value for key '{key}': "
+            f"list schema must contain exactly one "
+            f"element type, got {len(expected)}"
+        )
     if type(value) is not list:
         errors.append((key, f"expected list, got {type(value).__name__}",
                        "list", type(value).__name__))
         return _MISSING
-    result: list[Any] = []
-    for i, item in enumerate(value):
-        checked = _check_value(item, expected[0], f"{key}[{i}]",
+    item_type = expected[0]
+    leaf = type(item_type) is type
+    start = 0
+    if leaf:
+        # Copy the leading run of exact-type elements with one slice; only
+        # the rest, from the first mismatch on, goes through the full loop.
+        for start, item in enumerate(value):
+            if type(item) is not item_type:
+                break
+        else:
+            return value[:]
+    result: list[Any] = value[:start]
+    for i in range(start, len(value)):
+        item = value[i]
+        if leaf and type(item) is item_type:
+            result.append(item)  # exact-type element: no path or dispatch
+            continue
+        checked = _check_value(item, item_type, f"{key}[{i}]",
                                coerce, errors, depth, unknown_keys)
         if checked is not _MISSING:
             result.append(checked)
     return result
 
 
+def _check_union(value: Any, expected: types.UnionType, key: str, coerce: bool,
+                 errors: list[tuple[str, str, str, str]], depth: int,
+                 unknown_keys: UnknownKeysMode) -> Any:
+    """Match a value against union members, exact types before coercion"""
+    got = type(value)  # union members are distinct, so at most one is exact
+    if got in expected.__args__ and (not coerce or got is not str):
+        return value
+    if coerce:
+        for t in expected.__args__:
+            try:
+                return _coerce_value(value, t, key)
+            except ValueError:
+                pass
+    type_names = " | ".join(t.__name__ for t in expected.__args__)
+    errors.append((key, f"expected {type_names}, got {type(value).__name__}",
+                   type_names, type(value).__name__))
+    return _MISSING
+
+
 def _check_type(value: Any, expected: type, key: str, coerce: bool,
-                errors: list[tuple[str, str, str, str]]) -> Any:
+                errors: list[tuple[str, str, str, str]], depth: int,
+                unknown_keys: UnknownKeysMode) -> Any:
     """Check a value against an expected type with optional coercion"""
     if type(value) is expected:
         return value
@@ -176,59 +257,52 @@ def _check_type(value: Any, expected: type, key: str, coerce: bool,
     return _MISSING
 
 
+def _check_callable(value: Any, expected: Callable[[Any], Any], key: str,
+                    coerce: bool, errors: list[tuple[str, str, str, str]],
+                    depth: int, unknown_keys: UnknownKeysMode) -> Any:
+    """Run a custom validator callable against a value"""
+    try:
+        if expected(value):
+            return value
+    except Exception as exc:
+        errors.append((
+            key,
+            f"custom validation failed ({type(exc).__name__}: {exc})",
+            "callable",
+            "failed",
+        ))
+        return _MISSING
+    errors.append((key, "custom validation failed", "callable", "failed"))
+    return _MISSING
+
+
+# Exact schema-value type -> checker. Subclasses and other callables miss
+# and fall back to the isinstance checks in _check_value.
+_SCHEMA_CHECKS: dict[type, Callable[..., Any]] = {
+    dict: _check_dict, list: _check_list, types.UnionType: _check_union,
+    type: _check_type, types.FunctionType: _check_callable,
+    types.BuiltinFunctionType: _check_callable,
+}
+
+
 def _check_value(value: Any, expected: Any, key: str, coerce: bool,
                  errors: list[tuple[str, str, str, str]], depth: int,
                  unknown_keys: UnknownKeysMode) -> Any:
     """Validate one value against one schema entry"""
-    if isinstance(expected, dict):
-        if type(value) is not dict:
-            errors.append((key, f"expected dict, got {type(value).__name__}",
-                           "dict", type(value).__name__))
-            return _MISSING
-        return _validate(expected, value, coerce,
-                         key + ".", errors, depth - 1, unknown_keys)
-    if isinstance(expected, list) and len(expected) == 1:
-        return _check_list(value, expected, key, coerce, errors, depth, unknown_keys)
-    if isinstance(expected, list):
-        raise TypeError(
-            f"invalid schema value for key '{key}': "
-            f"list schema must contain exactly one "
-            f"element type, got {len(expected)}"
-        )
-    if isinstance(expected, types.UnionType):
-        for t in expected.__args__:
-            if type(value) is t and (not coerce or t is not str):
-                return value
-        if coerce:
-            for t in expected.__args__:
-                try:
-                    return _coerce_value(value, t, key)
-                except ValueError:
-                    pass
-        type_names = " | ".join(t.__name__ for t in expected.__args__)
-        errors.append((key, f"expected {type_names}, got {type(value).__name__}",
-                       type_names, type(value).__name__))
-        return _MISSING
-    if type(expected) is type:
-        return _check_type(value, expected, key, coerce, errors)
-    if callable(expected):
-        try:
-            if expected(value):
-                return value
-        except Exception as exc:
-            errors.append((
-                key,
-                f"custom validation failed ({type(exc).__name__}: {exc})",
-                "callable",
-                "failed",
-            ))
-            return _MISSING
-        errors.append((key, "custom validation failed", "callable", "failed"))
-        return _MISSING
-    raise TypeError(
-        f"invalid schema value for key '{key}': "
-        f"{expected!r}"
-    )
+    check = _SCHEMA_CHECKS.get(type(expected))
+    if check is None:
+        if isinstance(expected, dict):
+            check = _check_dict
+        elif isinstance(expected, list):
+            check = _check_list
+        elif callable(expected):
+            check = _check_callable
+        else:
+            raise TypeError(
+                f"invalid schema value for key '{key}': "
+                f"{expected!r}"
+            )
+    return check(value, expected, key, coerce, errors, depth, unknown_keys)
 
 
 def _validate(schema: dict[str, Any], data: dict[str, Any], coerce: bool,
@@ -241,32 +315,38 @@ def _validate(schema: dict[str, Any], data: dict[str, Any], coerce: bool,
                        "max depth exceeded",
                        "max_depth", "exceeded"))
         return result
+    absent = 0  # schema keys not in data; the rest of data is unknown keys
     for key, expected in schema.items():
-        if isinstance(expected, Optional):
+        kind = type(expected)  # plain types can never be Optional: skip isinstance
+        if kind is Optional or (kind is not type and isinstance(expected, Optional)):
+            if key not in data:  # absent optionals are routine: no raise
+                absent += 1
+                if expected.default is not _MISSING:
+                    result[key] = expected.default
+                continue
             exp = expected.type
-            default = expected.default
+            value = data[key]
         else:
             exp = expected
-            default = _MISSING
-        full_key = f"{prefix}{key}"
-        if key not in data:
-            if default is not _MISSING:
-                result[key] = default
-            elif isinstance(expected, Optional):
-                pass  # no default, key absent from result
-            else:
+            try:
+                value = data[key]  # one lookup on the common hit path
+            except KeyError:
+                absent += 1
                 errors.append((
-                    full_key, "missing required key",
+                    f"{prefix}{key}", "missing required key",
                     "required", "missing",
                 ))
+                continue
+        if type(value) is exp and type(exp) is type:
+            result[key] = value  # exact-type leaf: skip _check_value dispatch
             continue
         checked = _check_value(
-            data[key], exp, full_key, coerce, errors, depth,
+            value, exp, f"{prefix}{key}", coerce, errors, depth,
             unknown_keys,
         )
         if checked is not _MISSING:
             result[key] = checked
-    if unknown_keys == "reject":
+    if unknown_keys == "reject" and len(data) > len(schema) - absent:
         for key in data:
             if key not in schema:
                 errors.append((f"{prefix}{key}", "unknown key",
@@ -283,6 +363,7 @@ def validate(
     max_depth: int = 32,
     unknown_keys: UnknownKeysMode = "reject",
     error_mode: ErrorMode = "text",
+    fail_fast: bool = False,
 ) -> _SchemaT:
     ...
 
@@ -296,6 +377,7 @@ def validate(
     max_depth: int = 32,
     unknown_keys: Literal["reject"] = "reject",
     error_mode: ErrorMode = "text",
+    fail_fast: bool = False,
 ) -> dict[str, _SchemaValueT]:
     ...
 
@@ -309,6 +391,7 @@ def validate(
     max_depth: int = 32,
     unknown_keys: Literal["reject"] = "reject",
     error_mode: ErrorMode = "text",
+    fail_fast: bool = False,
 ) -> dict[str, _DictValueT]:
     ...
 
@@ -322,6 +405,7 @@ def validate(
     max_depth: int = 32,
     unknown_keys: Literal["strip"],
     error_mode: ErrorMode = "text",
+    fail_fast: bool = False,
 ) -> dict[str, Any]:
     ...
 
@@ -334,6 +418,7 @@ def validate(
     max_depth: int = 32,
     unknown_keys: UnknownKeysMode = "reject",
     error_mode: ErrorMode = "text",
+    fail_fast: bool = False,
 ) -> _SchemaT | dict[str, Any]:
     """Validate a dict against a plain schema dict or Schema subclass
 
@@ -351,6 +436,9 @@ def validate(
                     (default). ``"structured"`` raises
                     ``ValidationError`` with ``.issues`` list
                     of dicts.
+        fail_fast: If True, stop at the first error and
+                   report only that one instead of
+                   collecting every error.
 
     Returns:
         A new plain dict for dict-schema input, or a dict-
@@ -377,11 +465,16 @@ def validate(
         unknown_keys,
         error_mode,
     )
-    errors: list[tuple[str, str, str, str]] = []
-    result = _validate(
-        normalized_schema, data, coerce, "", errors, max_depth,
-        resolved_unknown_keys,
+    errors: list[tuple[str, str, str, str]] = (
+        _FailFastErrors() if fail_fast else []
     )
+    try:
+        result = _validate(
+            normalized_schema, data, coerce, "", errors, max_depth,
+            resolved_unknown_keys,
+        )
+    except _StopValidation:
+        result = {}
     if errors:
         if resolved_error_mode == "structured":
             raise ValidationError([
@@ -449,6 +542,7 @@ class Validator:
         max_depth: Default value for ``validate(..., max_depth=...)``.
         unknown_keys: Default value for ``validate(..., unknown_keys=...)``.
         error_mode: Default value for ``validate(..., error_mode=...)``.
+        fail_fast: Default value for ``validate(..., fail_fast=...)``.
 
     Example:
         >>> from zodify import Validator
@@ -457,12 +551,13 @@ class Validator:
         {'port': 8080}
     """
 
-    __slots__ = ("coerce", "max_depth", "unknown_keys", "error_mode")
+    __slots__ = ("coerce", "max_depth", "unknown_keys", "error_mode", "fail_fast")
 
     coerce: bool
     max_depth: int
     unknown_keys: UnknownKeysMode
     error_mode: ErrorMode
+    fail_fast: bool
 
     def __init__(
         self,
@@ -471,6 +566,7 @@ class Validator:
         max_depth: int = 32,
         unknown_keys: UnknownKeysMode = "reject",
         error_mode: ErrorMode = "text",
+        fail_fast: bool = False,
     ) -> None:
         resolved_unknown_keys, resolved_error_mode = _resolve_mode_options(
             unknown_keys,
@@ -480,6 +576,7 @@ class Validator:
         self.max_depth = max_depth
         self.unknown_keys = resolved_unknown_keys
         self.error_mode = resolved_error_mode
+        self.fail_fast = fail_fast
 
     @overload
     def validate(
@@ -491,6 +588,7 @@ class Validator:
         max_depth: int = ...,
         unknown_keys: UnknownKeysMode = ...,
         error_mode: ErrorMode = ...,
+        fail_fast: bool = ...,
     ) -> _SchemaT:
         ...
 
@@ -504,6 +602,7 @@ class Validator:
         max_depth: int = ...,
         unknown_keys: Literal["reject"] = ...,
         error_mode: ErrorMode = ...,
+        fail_fast: bool = ...,
     ) -> dict[str, _SchemaValueT]:
         ...
 
@@ -517,6 +616,7 @@ class Validator:
         max_depth: int = ...,
         unknown_keys: Literal["reject"] = ...,
         error_mode: ErrorMode = ...,
+        fail_fast: bool = ...,
     ) -> dict[str, _DictValueT]:
         ...
 
@@ -530,6 +630,7 @@ class Validator:
         max_depth: int = ...,
         unknown_keys: Literal["strip"],
         error_mode: ErrorMode = ...,
+        fail_fast: bool = ...,
     ) -> dict[str, Any]:
         ...
 
@@ -538,26 +639,25 @@ class Validator:
         schema: type[_SchemaT] | dict[str, Any],
         data: dict[str, Any],
         *,
-        coerce: object = _MISSING,
-        max_depth: object = _MISSING,
-        unknown_keys: object = _MISSING,
-        error_mode: object = _MISSING,
+        coerce: Any = _MISSING,
+        max_depth: Any = _MISSING,
+        unknown_keys: Any = _MISSING,
+        error_mode: Any = _MISSING,
+        fail_fast: Any = _MISSING,
     ) -> _SchemaT | dict[str, Any]:
-        use_coerce = self.coerce if coerce is _MISSING else coerce
-        use_max_depth = self.max_depth if max_depth is _MISSING else max_depth
-        use_unknown_keys = (
-            self.unknown_keys
-            if unknown_keys is _MISSING
-            else unknown_keys
-        )
-        use_error_mode = self.error_mode if error_mode is _MISSING else error_mode
+        # Overloads carry the public types; Any here avoids per-call cast()s.
         return validate(
             schema,
             data,
-            coerce=typing_cast(bool, use_coerce),
-            max_depth=typing_cast(int, use_max_depth),
-            unknown_keys=typing_cast(UnknownKeysMode, use_unknown_keys),
-            error_mode=typing_cast(ErrorMode, use_error_mode),
+            coerce=self.coerce if coerce is _MISSING else coerce,
+            max_depth=self.max_depth if max_depth is _MISSING else max_depth,
+            unknown_keys=(
+                self.unknown_keys
+                if unknown_keys is _MISSING
+                else unknown_keys
+            ),
+            error_mode=self.error_mode if error_mode is _MISSING else error_mode,
+            fail_fast=self.fail_fast if fail_fast is _MISSING else fail_fast,
         )
 
 